@@ -65,7 +65,7 @@ def create_economic_analyst():
     eco_agent = ReActAgent(
         llm=llm,
         name='Economic Analyst',
-        tools=[hardcoded_interest_tool,worldbank_inflation_tool,worldbank_tool,yahoofinance_tool, market_indices_tool, sector_performance_tool],
+        tools=[hardcoded_interest_tool(), worldbank_inflation_tool(), worldbank_tool(), yahoofinance_tool(), market_indices_tool(), sector_performance_tool()],
         description='You analyze inflation, interest rates, GDP growth, and market trends.')
     eco_agent.update_prompts({"react_header": eco_prompt})
     return eco_agent
@@ -1,7 +1,7 @@
 from llama_index.core.agent import ReActAgent
 from llama_index.llms.nebius import NebiusLLM
 from llama_index.core.prompts import PromptTemplate
-from tools.country_tax_db import ALL_TAX_TOOLS  # Already wrapped as FunctionTool
+from tools.country_tax_db import all_tax_tools  # Builds the FunctionTools on first use
 import os
 
 NEBIUS_API_KEY = os.getenv("NEBIUS_API_KEY-1")
@@ -100,7 +100,7 @@ def create_strategy_advisor():
     strat_agent = ReActAgent(
         name="Strategy Advisor",
         description="Generates personalized investment strategies based on user profile and economic/tax context.",
-        tools=[ALL_TAX_TOOLS],
+        tools=all_tax_tools(),
         llm=llm,
         system_prompt=strat_prompt.template,
         verbose=False
@@ -1,18 +1,166 @@
 # app.py - Enhanced Professional UI
 import gradio as gr
-import requests
-import json
 import asyncio
-import aiohttp
-from typing import Optional
+import atexit
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
+import random
+import re
+import threading
+import time
+import orjson
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import aiohttp
 
 # Update this to your new optimized Modal URL
 MODAL_URL = "https://devsam2898--personal-investment-strategist-optimized-web.modal.run/strategy"
 HEALTH_URL = "https://devsam2898--personal-investment-strategist-optimized-web.modal.run/health"
 TEST_URL = "https://devsam2898--personal-investment-strategist-optimized-web.modal.run/test"
 
-async def get_investment_strategy_async(age_group, income, expenses, risk_profile, goal, timeframe, country):
-    """Async version with better timeout handling"""
+# Long-lived event loop on a daemon thread; the sync Gradio handlers submit their
+# coroutines here so the shared session and its connections survive between clicks
+_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_LOOP.run_forever, name="modal-client-loop", daemon=True).start()
+
+@functools.cache
+def _aiohttp():
+    """Import aiohttp on first use so the UI starts without loading it"""
+    import aiohttp
+    return aiohttp
+
+# aiohttp only decodes Brotli when brotli (or brotlicffi) is installed, so only
+# advertise br then; otherwise a br response would reach orjson still compressed
+_ACCEPT_ENCODING = (
+    "br, gzip"
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+    else "gzip"
+)
+
+# Shared ClientSession so pooled keep-alive connections are reused
+_SESSION: "Optional[aiohttp.ClientSession]" = None
+
+async def _get_session() -> "aiohttp.ClientSession":
+    """Return the shared session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        aiohttp = _aiohttp()
+        _SESSION = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=150),  # 2.5 minute timeout
+            # Only the Modal host is ever contacted: a small pool with a long DNS cache
+            connector=aiohttp.TCPConnector(
+                limit=10,
+                limit_per_host=10,
+                use_dns_cache=True,
+                ttl_dns_cache=3600,
+                force_close=False,
+                keepalive_timeout=75
+            )
+        )
+    return _SESSION
+
+async def _close_session():
+    """Close the shared session, if any"""
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+
+# Everything but digits, dot and minus, e.g. "$75,000" -> "75000"
+_NUM_RE = re.compile(r'[^\d.\-]')
+def _to_money(value) -> float:
+    """Parse a money input; gr.Number already gives a number, text like "$6,000" is stripped"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not value:
+        return 0.0
+    return float(_NUM_RE.sub('', str(value)) or 0)
+
+# Regional-indicator pair (flag emoji) plus trailing space, e.g. "🇺🇸 United States"
+_FLAG_RE = re.compile(r'[\U0001F1E6-\U0001F1FF]{2}\s*')
+
+# Shown when a strategy request runs out of time, in the coroutine or in the sync wrapper
+_TIMEOUT_MSG = """⏱️ **Request Timeout**
+
+The AI service is taking longer than expected. This could be due to:
+- High server load
+- Cold start (first request after idle period)
+- Network connectivity issues
+
+**What to try:**
+1. Wait 30 seconds and try again
+2. Simplify your goal description
+3. Check if the service is healthy using the 'Test Service' button"""
+
+_TEST_TIMEOUT_MSG = """⏱️ **Service Test Timed Out**
+
+The status checks did not finish in time. The service may be cold starting; wait a minute and try again."""
+
+# Shortest free-text inputs worth sending to the LLM
+_MIN_GOAL_CHARS = 8
+_MIN_TIMEFRAME_CHARS = 2
+
+# Retry transient Modal failures (cold starts, overload) within one request
+_MAX_ATTEMPTS = 3
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_REQUEST_DEADLINE = 150  # seconds across all attempts
+_RETRY_WINDOW = 120  # no new attempt is started after this many seconds
+
+def _retry_allowed(attempt: int, started: float, wait: float) -> bool:
+    """Whether another attempt is left and starts inside the retry window"""
+    elapsed = asyncio.get_running_loop().time() - started
+    return attempt + 1 < _MAX_ATTEMPTS and elapsed + wait < _RETRY_WINDOW
+
+# JSON body for /strategy; field order is fixed, so the same inputs always yield the same bytes
+_PAYLOAD_TMPL = (
+    '{{"profile":{{"age_group":{age},"income":{inc},"expenses":{exp},'
+    '"risk_profile":{risk},"goal":{goal},"timeframe":{tf},"country":{c}}}}}'
+)
+
+def _json(value) -> str:
+    """Serialize a single payload field as JSON text"""
+    return orjson.dumps(value).decode()
+
+# Recent strategies keyed by request payload: key -> (stored_at, markdown).
+# Only touched from _LOOP, so no locking is needed.
+_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_CACHE_MAX_ENTRIES = 128
+_CACHE_TTL = 600  # seconds
+
+def _cache_get(key: str) -> Optional[str]:
+    """Return a fresh cached strategy for key, or None"""
+    entry = _CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at >= _CACHE_TTL:
+        del _CACHE[key]
+        return None
+    _CACHE.move_to_end(key)
+    return value
+
+def _cache_put(key: str, value: str):
+    """Store a strategy, evicting the least recently used entries past the limit"""
+    _CACHE[key] = (time.monotonic(), value)
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > _CACHE_MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+
+@atexit.register
+def _shutdown_loop():
+    """Close the shared session on interpreter exit"""
+    if _LOOP.is_running():
+        asyncio.run_coroutine_threadsafe(_close_session(), _LOOP).result(timeout=5)
+
+def _no_progress(fraction, desc=None):
+    """Progress callback used when the caller doesn't track progress"""
+
+async def get_investment_strategy_async(age_group, income, expenses, risk_profile, goal, timeframe, country, progress=_no_progress):
+    """Async version with better timeout handling; progress(fraction, desc=...) is called at each stage"""
     
     # Input validation
     if not all([age_group, income, expenses, risk_profile, goal, timeframe, country]):
@@ -20,8 +168,8 @@ async def get_investment_strategy_async(age_group, income, expenses, risk_profil
     
     # Convert income and expenses to numbers
     try:
-        income_val = float(str(income).replace('$', '').replace(',', '')) if income else 0
-        expenses_val = float(str(expenses).replace('$', '').replace(',', '')) if expenses else 0
+        income_val = _to_money(income)
+        expenses_val = _to_money(expenses)
     except ValueError:
         return "❌ Please enter valid numbers for income and expenses."
     
@@ -32,65 +180,91 @@ async def get_investment_strategy_async(age_group, income, expenses, risk_profil
         return "❌ Expenses cannot be negative."
     if expenses_val >= income_val:
         return "⚠️ **Warning**: Your expenses are equal to or exceed your income. Consider budgeting advice before investing."
-
-    payload = {
-        "profile": {
-            "age_group": age_group,
-            "income": income_val,
-            "expenses": expenses_val,
-            "risk_profile": risk_profile,
-            "goal": goal,
-            "timeframe": timeframe,
-            "country": country
-        }
-    }
     
+    # Reject prompts too vague to be worth an LLM call
+    if len(goal.strip()) < _MIN_GOAL_CHARS:
+        return f"❌ Please describe your goal in more detail (min {_MIN_GOAL_CHARS} chars)."
+    if len(timeframe.strip()) < _MIN_TIMEFRAME_CHARS:
+        return "❌ Please enter a valid investment timeline, e.g. \"3-5 years\"."
+    
+    progress(0.1, desc="Inputs validated")
+
+    # Only the field values are serialized; the fixed skeleton comes from the template
+    body = _PAYLOAD_TMPL.format(
+        age=_json(age_group),
+        inc=_json(income_val),
+        exp=_json(expenses_val),
+        risk=_json(risk_profile),
+        goal=_json(goal),
+        tf=_json(timeframe),
+        c=_json(_FLAG_RE.sub('', country))
+    ).encode()
+    
+    # Identical inputs within the TTL are answered without calling Modal again
+    cache_key = hashlib.blake2b(body, digest_size=16).hexdigest()
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    aiohttp = _aiohttp()
     try:
         print(f"🚀 Sending request to: {MODAL_URL}")
         
-        # Use aiohttp for better async handling
-        timeout = aiohttp.ClientTimeout(total=150)  # 2.5 minute timeout
+        # Reuse the shared session so repeat requests skip the TCP/TLS handshake
+        session = await _get_session()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
         
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(
-                MODAL_URL,
-                json=payload,
-                headers={
-                    'Content-Type': 'application/json',
-                    'Accept': 'application/json'
-                }
-            ) as response:
-                
-                print(f"📊 Response status: {response.status}")
-                
-                if response.status == 200:
-                    result = await response.json()
-                    strategy = result.get("strategy", "No strategy returned.")
-                    status = result.get("status", "unknown")
+        for attempt in range(_MAX_ATTEMPTS):
+            # Jittered, growing backoff so retries from several users don't line up
+            wait = random.uniform(2, 4) * (attempt + 1)
+            remaining = _REQUEST_DEADLINE - (loop.time() - started)
+            
+            progress(0.3, desc="Contacting AI advisor")
+            try:
+                async with session.post(
+                    MODAL_URL,
+                    data=body,
+                    headers={
+                        'Content-Type': 'application/json',
+                        'Accept': 'application/json',
+                        'Accept-Encoding': _ACCEPT_ENCODING
+                    },
+                    timeout=aiohttp.ClientTimeout(total=remaining)
+                ) as response:
                     
-                    # Add status indicator
-                    if status == "basic":
-                        prefix = "## 📊 Your Investment Strategy (Rule-Based)\n*AI service was unavailable, using optimized rule-based strategy*\n\n"
-                    else:
+                    print(f"📊 Response status: {response.status}")
+                    
+                    if response.status == 200:
+                        result = orjson.loads(await response.read())
+                        progress(0.9, desc="Formatting strategy")
+                        strategy = result.get("strategy", "No strategy returned.")
+                        status = result.get("status", "unknown")
+                        
+                        # Add status indicator
+                        if status == "basic":
+                            prefix = "## 📊 Your Investment Strategy (Rule-Based)\n*AI service was unavailable, using optimized rule-based strategy*\n\n"
+                            return f"{prefix}{strategy}"
+                        
                         prefix = "## 📊 Your Personalized Investment Strategy\n*Powered by AI*\n\n"
+                        result_md = f"{prefix}{strategy}"
+                        # Rule-based fallbacks are not cached so the AI result is fetched once it recovers
+                        _cache_put(cache_key, result_md)
+                        return result_md
                     
-                    return f"{prefix}{strategy}"
-                else:
-                    error_text = await response.text()
-                    return f"❌ **Service Error ({response.status})**\n\nThe backend service returned an error. Please try again in a moment.\n\nDetails: {error_text[:200]}..."
+                    if response.status not in _RETRY_STATUSES or not _retry_allowed(attempt, started, wait):
+                        error_text = await response.text()
+                        return f"❌ **Service Error ({response.status})**\n\nThe backend service returned an error. Please try again in a moment.\n\nDetails: {error_text[:200]}..."
+            
+            except (aiohttp.ClientConnectorError, asyncio.TimeoutError):
+                if not _retry_allowed(attempt, started, wait):
+                    raise
+            
+            print(f"🔁 Attempt {attempt + 1} failed, retrying in {wait:.1f}s")
+            await asyncio.sleep(wait)
                     
     except asyncio.TimeoutError:
-        return """⏱️ **Request Timeout**
-
-The AI service is taking longer than expected. This could be due to:
-- High server load
-- Cold start (first request after idle period)
-- Network connectivity issues
-
-**What to try:**
-1. Wait 30 seconds and try again
-2. Simplify your goal description
-3. Check if the service is healthy using the 'Test Service' button"""
+        return _TIMEOUT_MSG
 
     except aiohttp.ClientError as e:
         return f"""🔌 **Connection Error**
@@ -116,48 +290,73 @@ An unexpected error occurred: {str(e)}
 
 Please try again or contact support if the issue persists."""
 
-def get_investment_strategy(age_group, income, expenses, risk_profile, goal, timeframe, country):
-    """Sync wrapper for async function"""
+def get_investment_strategy(age_group, income, expenses, risk_profile, goal, timeframe, country, progress=gr.Progress()):
+    """Sync wrapper for async function; the coroutine reports progress as it reaches each stage"""
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(
-            get_investment_strategy_async(age_group, income, expenses, risk_profile, goal, timeframe, country)
+        future = asyncio.run_coroutine_threadsafe(
+            get_investment_strategy_async(age_group, income, expenses, risk_profile, goal, timeframe, country, progress),
+            _LOOP
         )
-        loop.close()
-        return result
+        return future.result(timeout=160)
+    except concurrent.futures.TimeoutError:
+        # Stop the request on _LOOP as well, not just the wait for it
+        future.cancel()
+        return _TIMEOUT_MSG
     except Exception as e:
         return f"❌ **Error**: {str(e)}"
 
+async def _get_json(session, url, timeout):
+    """GET url and return (status, parsed JSON body or None when not 200)"""
+    async with session.get(url, timeout=timeout) as response:
+        if response.status == 200:
+            return response.status, orjson.loads(await response.read())
+        return response.status, None
+
+# Last status report as (checked_at, markdown); repeat clicks within the TTL reuse it
+_HEALTH_CACHE: Optional[tuple[float, str]] = None
+_HEALTH_CACHE_TTL = 30  # seconds
+
 async def test_service_async():
     """Test service connectivity"""
+    global _HEALTH_CACHE
+    if _HEALTH_CACHE is not None and time.monotonic() - _HEALTH_CACHE[0] < _HEALTH_CACHE_TTL:
+        return _HEALTH_CACHE[1]
+    
     try:
-        timeout = aiohttp.ClientTimeout(total=30)
+        timeout = _aiohttp().ClientTimeout(total=30)
+        session = await _get_session()
         
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            # Test health endpoint first
-            try:
-                async with session.get(HEALTH_URL) as response:
-                    if response.status == 200:
-                        health_data = await response.json()
-                        health_status = f"✅ Service is healthy\n- Status: {health_data.get('status')}\n- Timestamp: {health_data.get('timestamp')}"
-                    else:
-                        health_status = f"⚠️ Health check returned status {response.status}"
-            except Exception as e:
-                health_status = f"❌ Health check failed: {str(e)}"
-            
-            # Test strategy endpoint with sample data
-            try:
-                async with session.get(TEST_URL) as response:
-                    if response.status == 200:
-                        test_data = await response.json()
-                        test_status = f"✅ Test endpoint working\n- Result: {test_data.get('test_result')}"
-                    else:
-                        test_status = f"⚠️ Test endpoint returned status {response.status}"
-            except Exception as e:
-                test_status = f"❌ Test endpoint failed: {str(e)}"
-            
-            return f"""## 🔍 Service Status Check
+        # Probe health and the test endpoint concurrently
+        health_res, test_res = await asyncio.gather(
+            _get_json(session, HEALTH_URL, timeout),
+            _get_json(session, TEST_URL, timeout),
+            return_exceptions=True
+        )
+        
+        if isinstance(health_res, BaseException):
+            health_status = f"❌ Health check failed: {str(health_res)}"
+        else:
+            status_code, health_data = health_res
+            if health_data is not None:
+                health_status = f"✅ Service is healthy\n- Status: {health_data.get('status')}\n- Timestamp: {health_data.get('timestamp')}"
+            else:
+                health_status = f"⚠️ Health check returned status {status_code}"
+        
+        if isinstance(test_res, BaseException):
+            test_status = f"❌ Test endpoint failed: {str(test_res)}"
+        else:
+            status_code, test_data = test_res
+            if test_data is not None:
+                test_status = f"✅ Test endpoint working\n- Result: {test_data.get('test_result')}"
+            else:
+                test_status = f"⚠️ Test endpoint returned status {status_code}"
+        
+        healthy = (
+            not isinstance(health_res, BaseException) and health_res[1] is not None
+            and not isinstance(test_res, BaseException) and test_res[1] is not None
+        )
+        
+        report = f"""## 🔍 Service Status Check
 
 **Health Check:**
 {health_status}
@@ -167,8 +366,12 @@ async def test_service_async():
 
 **Service URL:** {MODAL_URL}
 
-*Last checked: {asyncio.get_event_loop().time()}*"""
-            
+*Last checked: {datetime.now(timezone.utc).isoformat(timespec="seconds")}*"""
+        # Only a fully healthy report is reused; failures are re-probed on the next click
+        if healthy:
+            _HEALTH_CACHE = (time.monotonic(), report)
+        return report
+        
     except Exception as e:
         return f"""❌ **Service Test Failed**
 
@@ -184,286 +387,21 @@ Error: {str(e)}
 def test_service():
     """Sync wrapper for service test"""
     try:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(test_service_async())
-        loop.close()
-        return result
+        future = asyncio.run_coroutine_threadsafe(test_service_async(), _LOOP)
+        return future.result(timeout=70)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        return _TEST_TIMEOUT_MSG
     except Exception as e:
         return f"❌ **Test Error**: {str(e)}"
 
-# Enhanced professional CSS styling
-custom_css = """
-/* Global container styling */
-.gradio-container {
-    max-width: 1400px !important;
-    margin: 0 auto !important;
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-    min-height: 100vh;
-    font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-}
-
-/* Main content area */
-.main-content {
-    background: rgba(255, 255, 255, 0.95) !important;
-    backdrop-filter: blur(20px) !important;
-    border-radius: 20px !important;
-    padding: 2rem !important;
-    margin: 2rem !important;
-    box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1) !important;
-    border: 1px solid rgba(255, 255, 255, 0.2) !important;
-}
-
-/* Header styling */
-.finance-header {
-    text-align: center;
-    background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-    color: white;
-    padding: 3rem 2rem;
-    border-radius: 20px;
-    margin-bottom: 2rem;
-    position: relative;
-    overflow: hidden;
-}
-
-.finance-header::before {
-    content: "";
-    position: absolute;
-    top: 0;
-    left: 0;
-    right: 0;
-    bottom: 0;
-    background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="grain" width="100" height="100" patternUnits="userSpaceOnUse"><circle cx="50" cy="50" r="0.5" fill="rgba(255,255,255,0.1)"/></pattern></defs><rect width="100" height="100" fill="url(%23grain)"/></svg>');
-    opacity: 0.1;
-}
-
-.finance-header h1 {
-    font-size: 3rem !important;
-    font-weight: 800 !important;
-    margin-bottom: 1rem !important;
-    background: linear-gradient(45deg, #ffffff, #e0e7ff);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    position: relative;
-    z-index: 1;
-}
-
-.finance-header p {
-    font-size: 1.25rem !important;
-    opacity: 0.9 !important;
-    margin-bottom: 0 !important;
-    position: relative;
-    z-index: 1;
-}
-
-/* Icon styling */
-.finance-icon {
-    font-size: 4rem;
-    margin-bottom: 1rem;
-    position: relative;
-    z-index: 1;
-}
-
-/* Form sections */
-.form-section {
-    background: white !important;
-    border-radius: 16px !important;
-    padding: 2rem !important;
-    margin-bottom: 1.5rem !important;
-    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08) !important;
-    border: 1px solid rgba(255, 255, 255, 0.2) !important;
-    transition: all 0.3s ease !important;
-}
-
-.form-section:hover {
-    box-shadow: 0 12px 40px rgba(0, 0, 0, 0.12) !important;
-    transform: translateY(-2px) !important;
-}
-
-.form-section h3 {
-    color: #ffffff !important;
-    font-weight: 700 !important;
-    font-size: 1.5rem !important;
-    margin-bottom: 1.5rem !important;
-    display: flex !important;
-    align-items: center !important;
-    gap: 0.75rem !important;
-}
-
-/* Input styling */
-.gradio-textbox, .gradio-number {
-    border-radius: 12px !important;
-    border: 2px solid #e5e7eb !important;
-    transition: all 0.3s ease !important;
-    font-size: 1rem !important;
-    padding: 0.75rem 1rem !important;
-}
-
-.gradio-textbox:focus, .gradio-number:focus {
-    border-color: #667eea !important;
-    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1) !important;
-    outline: none !important;
-}
-
-/* Dropdown styling - more specific selectors */
-.gradio-dropdown .wrap {
-    border-radius: 12px !important;
-    border: 2px solid #e5e7eb !important;
-    transition: all 0.3s ease !important;
-}
-
-.gradio-dropdown .wrap:focus-within {
-    border-color: #667eea !important;
-    box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1) !important;
-}
-
-.gradio-dropdown select, .gradio-dropdown input {
-    font-size: 1rem !important;
-    padding: 0.75rem 1rem !important;
-    border: none !important;
-    background: transparent !important;
-}
-
-.gradio-dropdown .dropdown {
-    border-radius: 12px !important;
-    border: 2px solid #e5e7eb !important;
-    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1) !important;
-}
-
-/* Button styling */
-.primary-btn {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-    border: none !important;
-    border-radius: 12px !important;
-    padding: 1rem 2rem !important;
-    font-size: 1.1rem !important;
-    font-weight: 600 !important;
-    color: white !important;
-    transition: all 0.3s ease !important;
-    box-shadow: 0 8px 24px rgba(102, 126, 234, 0.3) !important;
-    min-height: 56px !important;
-}
-
-.primary-btn:hover {
-    transform: translateY(-2px) !important;
-    box-shadow: 0 12px 32px rgba(102, 126, 234, 0.4) !important;
-}
-
-.secondary-btn {
-    background: linear-gradient(135deg, #64748b 0%, #475569 100%) !important;
-    border: none !important;
-    border-radius: 12px !important;
-    padding: 1rem 2rem !important;
-    font-size: 1.1rem !important;
-    font-weight: 600 !important;
-    color: white !important;
-    transition: all 0.3s ease !important;
-    box-shadow: 0 8px 24px rgba(100, 116, 139, 0.3) !important;
-    min-height: 56px !important;
-}
-
-.secondary-btn:hover {
-    transform: translateY(-2px) !important;
-    box-shadow: 0 12px 32px rgba(100, 116, 139, 0.4) !important;
-}
-
-/* Output area styling */
-.output-area {
-    background: white !important;
-    border-radius: 16px !important;
-    padding: 2rem !important;
-    margin-top: 2rem !important;
-    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08) !important;
-    border: 1px solid rgba(255, 255, 255, 0.2) !important;
-    min-height: 200px !important;
-}
-
-/* Tips section */
-.tips-section {
-    background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%) !important;
-    border-radius: 16px !important;
-    padding: 2rem !important;
-    margin: 2rem 0 !important;
-    border-left: 4px solid #667eea !important;
-}
-
-.tips-section h4 {
-    color: #ffffff !important;
-    font-weight: 700 !important;
-    margin-bottom: 1rem !important;
-}
-
-/* Radio button styling */
-.gradio-radio {
-    gap: 1rem !important;
-}
-
-.gradio-radio label {
-    background: white !important;
-    border: 2px solid #e5e7eb !important;
-    border-radius: 12px !important;
-    padding: 1rem !important;
-    transition: all 0.3s ease !important;
-    cursor: pointer !important;
-}
-
-.gradio-radio label:hover {
-    border-color: #667eea !important;
-    background: #f8fafc !important;
-}
-
-.gradio-radio input:checked + label {
-    border-color: #667eea !important;
-    background: linear-gradient(135deg, #667eea10, #764ba210) !important;
-    color: #1e3c72 !important;
-}
-
-/* Progress indicator */
-.loading-indicator {
-    background: linear-gradient(90deg, #667eea, #764ba2, #667eea) !important;
-    background-size: 200% 100% !important;
-    animation: gradient 2s ease infinite !important;
-}
-
-@keyframes gradient {
-    0% { background-position: 0% 50%; }
-    50% { background-position: 100% 50%; }
-    100% { background-position: 0% 50%; }
-}
-
-/* Responsive design */
-@media (max-width: 768px) {
-    .finance-header h1 {
-        font-size: 2rem !important;
-    }
-    
-    .form-section {
-        padding: 1.5rem !important;
-    }
-    
-    .main-content {
-        margin: 1rem !important;
-        padding: 1.5rem !important;
-    }
-}
-
-/* Chart and finance icons */
-.finance-bg {
-    position: relative;
-    overflow: hidden;
-}
-
-.finance-bg::after {
-    content: "📈📊💰🏦💳📋";
-    position: absolute;
-    top: -20px;
-    right: -20px;
-    font-size: 6rem;
-    opacity: 0.05;
-    z-index: 0;
-    transform: rotate(12deg);
-}
-"""
+# Enhanced professional CSS styling, kept in static/app.css
+@functools.cache
+def _load_css() -> str:
+    """Read the stylesheet once and share it between Blocks builds"""
+    return (Path(__file__).parent / "static" / "app.css").read_text(encoding="utf-8")
+
+custom_css = _load_css()
 
 # Create the enhanced interface
 with gr.Blocks(
@@ -21,7 +21,10 @@ image = (
         "llama-index-llms-nebius",
         "langchain",
         "requests",
+        "httpx[http2]",
+        "orjson",
         "yfinance",
+        "pyarrow",
         "gradio"
     ).add_local_file(local_path="main.py", remote_path="/root/main.py")
     .add_local_dir('agents', remote_path='/root/agents')
@@ -1270,9 +1273,57 @@ def web():
                 "test_result": "Service is working",
                 "status": "success",
                 "timestamp": time.strftime('%Y-%m-%d %H:%M:%S UTC'),
-                "endpoints_available": ["/strategy", "/health", "/test"]
+                "endpoints_available": ["/strategy", "/health", "/test", "/status"]
             }
         
+        # Market check shared by all /status calls. wait_for can't stop the yfinance
+        # worker thread, so at most one fetch runs at a time and its summary is reused
+        # for a short while instead of stacking up scrapes against a slow Yahoo.
+        market_check = {"task": None, "result": None, "checked_at": 0.0}
+        MARKET_STATUS_TTL = 30  # seconds
+        
+        def summarize_market(indices: dict) -> dict:
+            if "error" in indices:
+                return {"status": "unavailable", "error": indices["error"]}
+            available = sum(1 for data in indices.values() if "error" not in data)
+            if available == 0:
+                return {"status": "unavailable", "error": "No market index data returned"}
+            return {
+                "status": "success",
+                "timestamp": time.strftime('%Y-%m-%d %H:%M:%S UTC'),
+                "indices_available": available
+            }
+        
+        def store_market(task):
+            # Also runs when a fetch finishes after its caller timed out
+            if not task.cancelled() and task.exception() is None:
+                market_check["result"] = summarize_market(task.result())
+                market_check["checked_at"] = time.monotonic()
+        
+        async def market_status():
+            if market_check["result"] is not None and time.monotonic() - market_check["checked_at"] < MARKET_STATUS_TTL:
+                return market_check["result"]
+            
+            task = market_check["task"]
+            if task is None or task.done():
+                # yfinance is blocking, so keep it off the event loop
+                task = asyncio.ensure_future(asyncio.to_thread(get_market_indices))
+                task.add_done_callback(store_market)
+                market_check["task"] = task
+            
+            try:
+                # shield keeps the shared fetch alive when this caller gives up
+                indices = await asyncio.wait_for(asyncio.shield(task), timeout=20)
+            except Exception as e:
+                return {"status": "unavailable", "error": str(e) or type(e).__name__}
+            return summarize_market(indices)
+        
+        @web_app.get("/status")
+        async def status_endpoint():
+            """Health, market data and test results in one response for the Gradio status check"""
+            health, market, test = await asyncio.gather(health_check(), market_status(), test_endpoint())
+            return {"health": health, "market": market, "test": test}
+        
         @web_app.get("/")
         async def root():
             """Root endpoint"""
@@ -1,5 +1,48 @@
 # country_tax_db.py - Complete tax rules and financial information database
-from llama_index.core.tools import FunctionTool
+from enum import IntEnum
+from functools import cache, lru_cache
+from types import MappingProxyType
+from pydantic import BaseModel
+
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _thaw(value):
+    """Inverse of _freeze: plain dicts and lists, e.g. for tool output that must print and serialize cleanly"""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+class Country(IntEnum):
+    """Countries covered by the tax database, used as table indices"""
+    USA = 0
+    INDIA = 1
+    UK = 2
+    CANADA = 3
+    FRANCE = 4
+    GERMANY = 5
+    ITALY = 6
+    JAPAN = 7
+
+# Database keys for each supported country
+_COUNTRY_FROM_STR = MappingProxyType({
+    "USA": Country.USA,
+    "India": Country.INDIA,
+    "UK": Country.UK,
+    "Canada": Country.CANADA,
+    "France": Country.FRANCE,
+    "Germany": Country.GERMANY,
+    "Italy": Country.ITALY,
+    "Japan": Country.JAPAN
+})
+_COUNTRY_NAMES = tuple(sorted(_COUNTRY_FROM_STR, key=_COUNTRY_FROM_STR.get))
 
 # Comprehensive tax rules database
 TAX_RULES = {
@@ -59,6 +102,8 @@ TAX_RULES = {
         "currency": "JPY"
     }
 }
+TAX_RULES = _freeze(TAX_RULES)
+_TAX_RULES_BY_COUNTRY = tuple(TAX_RULES[name] for name in _COUNTRY_NAMES)
 
 # Country-specific financial information database
 COUNTRY_FINANCIAL_INFO = {
@@ -127,26 +172,33 @@ COUNTRY_FINANCIAL_INFO = {
         "currency": "INR"
     }
 }
+_FINANCIAL_INFO_BY_COUNTRY = tuple(COUNTRY_FINANCIAL_INFO[name] for name in _COUNTRY_NAMES)
 
 def get_tax_rules(country="USA"):
     """Returns tax rules for a given country"""
-    return TAX_RULES.get(country, {})
+    idx = _COUNTRY_FROM_STR.get(country)
+    # A plain copy, so the LLM sees dict/list reprs instead of mappingproxy(...)
+    return _thaw(_TAX_RULES_BY_COUNTRY[idx]) if idx is not None else {}
 
+_FIN_INFO_TEMPLATE = (
+    "\n"
+    "• Capital Gains Tax: {capital_gains_tax}\n"
+    "• Income Tax Rate: {income_tax_rate}\n"
+    "• Current Interest Rate: {current_interest_rate}\n"
+    "• Tax-Advantaged Accounts: {tax_accounts}\n"
+    "• Common Investment Options: {investment_options}\n"
+    "• Currency: {currency}\n"
+)
+
+@lru_cache(maxsize=32)
 def get_country_financial_info(country: str) -> str:
     """Get country-specific tax and interest rate information"""
     
-    if country not in COUNTRY_FINANCIAL_INFO:
+    idx = _COUNTRY_FROM_STR.get(country)
+    if idx is None:
         return f"Limited tax information available for {country}. Consider consulting local financial advisors."
     
-    data = COUNTRY_FINANCIAL_INFO[country]
-    return f"""
-• Capital Gains Tax: {data['capital_gains_tax']}
-• Income Tax Rate: {data['income_tax_rate']}
-• Current Interest Rate: {data['current_interest_rate']}
-• Tax-Advantaged Accounts: {data['tax_accounts']}
-• Common Investment Options: {data['investment_options']}
-• Currency: {data['currency']}
-"""
+    return _FIN_INFO_TEMPLATE.format_map(_FINANCIAL_INFO_BY_COUNTRY[idx])
 
 def get_supported_countries():
     """Returns list of supported countries"""
@@ -155,9 +207,10 @@ def get_supported_countries():
 def calculate_tax_liability(country: str, income: float, capital_gains: float = 0) -> dict:
     """Calculate estimated tax liability for a given country"""
     
-    tax_rules = get_tax_rules(country)
-    if not tax_rules:
+    idx = _COUNTRY_FROM_STR.get(country)
+    if idx is None:
         return {"error": f"Tax rules not available for {country}"}
+    tax_rules = _TAX_RULES_BY_COUNTRY[idx]
     
     result = {
         "country": country,
@@ -170,18 +223,21 @@ def calculate_tax_liability(country: str, income: float, capital_gains: float =
     }
     
     try:
+        income_tax = 0
+        cg_tax = 0
+        
         # Calculate income tax
-        if country == "India":
+        if idx == Country.INDIA:
             # Special handling for India's slab system
-            if income <= tax_rules.get("tax_free_threshold", 0):
-                result["income_tax"] = 0
-            else:
-                taxable_income = income - tax_rules.get("tax_free_threshold", 0)
-                income_tax = 0
+            threshold = tax_rules.get("tax_free_threshold", 0)
+            slabs = tax_rules.get("slabs", ())
+            
+            if income > threshold:
+                taxable_income = income - threshold
                 
-                for slab in tax_rules.get("slabs", []):
+                for slab in slabs:
                     if "up_to" in slab:
-                        slab_limit = slab["up_to"] - tax_rules.get("tax_free_threshold", 0)
+                        slab_limit = slab["up_to"] - threshold
                         if taxable_income > slab_limit:
                             income_tax += slab_limit * slab["rate"]
                             taxable_income -= slab_limit
@@ -192,16 +248,17 @@ def calculate_tax_liability(country: str, income: float, capital_gains: float =
                     elif "above" in slab and taxable_income > 0:
                         income_tax += taxable_income * slab["rate"]
                         break
-                
-                result["income_tax"] = income_tax
         
         else:
             # Standard bracket system for other countries
-            brackets = tax_rules.get("income_brackets", [])
-            rates = tax_rules.get("rates", [])
+            brackets = tax_rules.get("income_brackets", ())
+            rates = tax_rules.get("rates", ())
+            
+            if len(brackets) >= 2 and len(brackets) == len(rates) and income <= brackets[1] - brackets[0]:
+                # Fast path: income falls entirely within the first bracket
+                income_tax = income * rates[0]
             
-            if len(brackets) == len(rates):
-                income_tax = 0
+            elif len(brackets) == len(rates):
                 remaining_income = income
                 
                 for i in range(len(brackets) - 1):
@@ -216,118 +273,174 @@ def calculate_tax_liability(country: str, income: float, capital_gains: float =
                 
                 if remaining_income > 0 and len(rates) > 0:
                     income_tax += remaining_income * rates[-1]
-                
-                result["income_tax"] = income_tax
         
         # Calculate capital gains tax
-        cg_rules = tax_rules.get("capital_gains", {})
         if capital_gains > 0:
-            if country == "UK":
+            cg_rules = tax_rules.get("capital_gains", {})
+            if idx == Country.UK:
                 # UK has allowance system
                 allowance = cg_rules.get("allowance", 0)
                 taxable_gains = max(0, capital_gains - allowance)
                 # Simplified: use basic rate for calculation
-                result["capital_gains_tax"] = taxable_gains * (cg_rules.get("basic_rate", 0) / 100)
+                cg_tax = taxable_gains * (cg_rules.get("basic_rate", 0) / 100)
             
-            elif country == "Canada":
+            elif idx == Country.CANADA:
                 # Canada includes 50% of capital gains as income
                 inclusion_rate = cg_rules.get("inclusion_rate", 0.5)
                 taxable_gains = capital_gains * inclusion_rate
                 # Simplified: use average rate
                 avg_rate = (cg_rules.get("rate_1", 15) + cg_rules.get("rate_2", 27)) / 2
-                result["capital_gains_tax"] = taxable_gains * (avg_rate / 100)
+                cg_tax = taxable_gains * (avg_rate / 100)
             
             elif "long_term" in cg_rules:
                 # USA system - assume long-term
-                result["capital_gains_tax"] = capital_gains * (cg_rules["long_term"] / 100)
+                cg_tax = capital_gains * (cg_rules["long_term"] / 100)
             
             elif "individual" in cg_rules:
                 # Flat rate systems (Germany, France, Italy, Japan)
-                result["capital_gains_tax"] = capital_gains * (cg_rules["individual"] / 100)
+                cg_tax = capital_gains * (cg_rules["individual"] / 100)
             
             elif "short_term" in cg_rules:
                 # India system - assume short-term for simplicity
-                result["capital_gains_tax"] = capital_gains * (cg_rules["short_term"] / 100)
+                cg_tax = capital_gains * (cg_rules["short_term"] / 100)
         
         # Calculate totals
-        result["total_tax"] = result["income_tax"] + result["capital_gains_tax"]
+        total_tax = income_tax + cg_tax
         total_income = income + capital_gains
-        result["effective_rate"] = (result["total_tax"] / total_income * 100) if total_income > 0 else 0
+        result.update(
+            income_tax=income_tax,
+            capital_gains_tax=cg_tax,
+            total_tax=total_tax,
+            effective_rate=(total_tax / total_income * 100) if total_income > 0 else 0
+        )
         
     except Exception as e:
         result["error"] = f"Calculation error: {str(e)}"
     
     return result
 
-def get_tax_efficient_strategies(country: str) -> list:
+# Tax-efficient investment strategies by country
+_STRATEGIES = {
+    "USA": [
+        "Maximize 401(k) contributions (up to $23,000 in 2024)",
+        "Use Roth IRA for tax-free growth ($7,000 limit)",
+        "Hold investments >1 year for long-term capital gains rates",
+        "Consider tax-loss harvesting",
+        "Use HSA as retirement account (triple tax advantage)"
+    ],
+    "Canada": [
+        "Maximize TFSA contributions first (tax-free growth)",
+        "Use RRSP for tax deduction (18% of income, max $31,560)",
+        "Hold Canadian eligible dividends for tax credit",
+        "Consider capital gains vs dividends tax treatment",
+        "Use RESP for children's education (government grants)"
+    ],
+    "UK": [
+        "Use ISA allowance (£20,000 annually, tax-free)",
+        "Maximize pension contributions (annual allowance £60,000)",
+        "Utilize capital gains allowance (£6,000 annually)",
+        "Consider dividend allowance (£1,000 tax-free)",
+        "Use bed and breakfast rules for tax-loss harvesting"
+    ],
+    "Germany": [
+        "Use Riester pension for tax benefits",
+        "Consider company pension schemes (bAV)",
+        "Utilize €1,000 annual capital gains exemption",
+        "Hold investments in tax-efficient funds",
+        "Consider real estate investment (no capital gains after 10 years)"
+    ],
+    "India": [
+        "Maximize ELSS investments (₹1.5 lakh 80C deduction)",
+        "Use PPF for long-term tax-free growth",
+        "Consider NPS for additional tax benefits",
+        "Hold equity investments >1 year for LTCG benefits",
+        "Use SIP for rupee cost averaging"
+    ],
+    "France": [
+        "Maximize PEA contributions (€150,000 limit, tax-free after 5 years)",
+        "Use Assurance Vie for tax-efficient growth",
+        "Consider company savings plans (PEE/PERCO)",
+        "Hold investments >8 years for reduced tax rates",
+        "Use life insurance for estate planning"
+    ],
+    "Italy": [
+        "Use PIR (Individual Savings Plans) for tax benefits",
+        "Consider pension funds for tax deductions",
+        "Maximize TFR (employee severance) investments",
+        "Hold government bonds for favorable tax treatment",
+        "Use life insurance for tax-efficient savings"
+    ],
+    "Japan": [
+        "Maximize iDeCo contributions (varies by employment status)",
+        "Use NISA for tax-free investment growth",
+        "Consider company pension schemes",
+        "Hold investments for long-term capital gains",
+        "Use life insurance for tax-efficient savings"
+    ]
+}
+_STRATEGIES = _freeze(_STRATEGIES)
+_STRATEGIES_BY_COUNTRY = tuple(_STRATEGIES[name] for name in _COUNTRY_NAMES)
+_DEFAULT_STRATEGIES = ("Consult local tax advisor for country-specific strategies",)
+
+def get_tax_efficient_strategies(country: str) -> tuple:
     """Get tax-efficient investment strategies for a specific country"""
     
-    strategies = {
-        "USA": [
-            "Maximize 401(k) contributions (up to $23,000 in 2024)",
-            "Use Roth IRA for tax-free growth ($7,000 limit)",
-            "Hold investments >1 year for long-term capital gains rates",
-            "Consider tax-loss harvesting",
-            "Use HSA as retirement account (triple tax advantage)"
-        ],
-        "Canada": [
-            "Maximize TFSA contributions first (tax-free growth)",
-            "Use RRSP for tax deduction (18% of income, max $31,560)",
-            "Hold Canadian eligible dividends for tax credit",
-            "Consider capital gains vs dividends tax treatment",
-            "Use RESP for children's education (government grants)"
-        ],
-        "UK": [
-            "Use ISA allowance (£20,000 annually, tax-free)",
-            "Maximize pension contributions (annual allowance £60,000)",
-            "Utilize capital gains allowance (£6,000 annually)",
-            "Consider dividend allowance (£1,000 tax-free)",
-            "Use bed and breakfast rules for tax-loss harvesting"
-        ],
-        "Germany": [
-            "Use Riester pension for tax benefits",
-            "Consider company pension schemes (bAV)",
-            "Utilize €1,000 annual capital gains exemption",
-            "Hold investments in tax-efficient funds",
-            "Consider real estate investment (no capital gains after 10 years)"
-        ],
-        "India": [
-            "Maximize ELSS investments (₹1.5 lakh 80C deduction)",
-            "Use PPF for long-term tax-free growth",
-            "Consider NPS for additional tax benefits",
-            "Hold equity investments >1 year for LTCG benefits",
-            "Use SIP for rupee cost averaging"
-        ],
-        "France": [
-            "Maximize PEA contributions (€150,000 limit, tax-free after 5 years)",
-            "Use Assurance Vie for tax-efficient growth",
-            "Consider company savings plans (PEE/PERCO)",
-            "Hold investments >8 years for reduced tax rates",
-            "Use life insurance for estate planning"
-        ],
-        "Italy": [
-            "Use PIR (Individual Savings Plans) for tax benefits",
-            "Consider pension funds for tax deductions",
-            "Maximize TFR (employee severance) investments",
-            "Hold government bonds for favorable tax treatment",
-            "Use life insurance for tax-efficient savings"
-        ],
-        "Japan": [
-            "Maximize iDeCo contributions (varies by employment status)",
-            "Use NISA for tax-free investment growth",
-            "Consider company pension schemes",
-            "Hold investments for long-term capital gains",
-            "Use life insurance for tax-efficient savings"
-        ]
-    }
-    
-    return strategies.get(country, ["Consult local tax advisor for country-specific strategies"])
+    idx = _COUNTRY_FROM_STR.get(country)
+    return _STRATEGIES_BY_COUNTRY[idx] if idx is not None else _DEFAULT_STRATEGIES
+
+# Explicit tool argument schemas (skips signature introspection at import)
+class CountryArg(BaseModel):
+    country: str = "USA"
+
+class RequiredCountryArg(BaseModel):
+    country: str
+
+class TaxLiabilityArgs(BaseModel):
+    country: str
+    income: float
+    capital_gains: float = 0
 
 # Wrap functions as LlamaIndex FunctionTools
-tax_tool = FunctionTool.from_defaults(fn=get_tax_rules)
-financial_info_tool = FunctionTool.from_defaults(fn=get_country_financial_info)
-tax_calculation_tool = FunctionTool.from_defaults(fn=calculate_tax_liability)
-tax_strategies_tool = FunctionTool.from_defaults(fn=get_tax_efficient_strategies)
+@cache
+def tax_tool():
+    from llama_index.core.tools import FunctionTool
+    return FunctionTool.from_defaults(
+        fn=get_tax_rules,
+        fn_schema=CountryArg,
+        name="get_tax_rules",
+        description="Get income tax brackets, capital gains rules and currency for a country (USA, India, UK, Canada, France, Germany, Italy, Japan)"
+    )
+
+@cache
+def financial_info_tool():
+    from llama_index.core.tools import FunctionTool
+    return FunctionTool.from_defaults(
+        fn=get_country_financial_info,
+        fn_schema=RequiredCountryArg,
+        name="get_country_financial_info",
+        description="Get a summary of tax rates, interest rate, tax-advantaged accounts and investment options for a country"
+    )
+
+@cache
+def tax_calculation_tool():
+    from llama_index.core.tools import FunctionTool
+    return FunctionTool.from_defaults(
+        fn=calculate_tax_liability,
+        fn_schema=TaxLiabilityArgs,
+        name="calculate_tax_liability",
+        description="Estimate annual income tax, capital gains tax and effective tax rate for a country, income and capital gains"
+    )
+
+@cache
+def tax_strategies_tool():
+    from llama_index.core.tools import FunctionTool
+    return FunctionTool.from_defaults(
+        fn=get_tax_efficient_strategies,
+        fn_schema=RequiredCountryArg,
+        name="get_tax_efficient_strategies",
+        description="Get tax-efficient investment strategies for a country"
+    )
 
 # Export all tools as a list for easy import
-ALL_TAX_TOOLS = [tax_tool, financial_info_tool, tax_calculation_tool, tax_strategies_tool]
\ No newline at end of file
+def all_tax_tools():
+    return [tax_tool(), financial_info_tool(), tax_calculation_tool(), tax_strategies_tool()]
\ No newline at end of file
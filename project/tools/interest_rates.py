@@ -1,6 +1,9 @@
 # This file has hardcoded most recent interest rates of the India and G7 countries.
 # tools/hardcoded_interest_rates.py
-from llama_index.core.tools import FunctionTool
+from functools import cache
+from types import MappingProxyType
+from pydantic import BaseModel
+from tools.country_tax_db import Country
 
 INTEREST_RATES = {
     "United States": {
@@ -36,9 +39,37 @@ INTEREST_RATES = {
         "as_of": "April 2025"
     }
 }
+INTEREST_RATES = MappingProxyType({k: MappingProxyType(v) for k, v in INTEREST_RATES.items()})
+
+# Table keys for each supported country
+_COUNTRY_FROM_STR = MappingProxyType({
+    "United States": Country.USA,
+    "India": Country.INDIA,
+    "United Kingdom": Country.UK,
+    "Canada": Country.CANADA,
+    "France": Country.FRANCE,
+    "Germany": Country.GERMANY,
+    "Italy": Country.ITALY,
+    "Japan": Country.JAPAN
+})
+_RATES_BY_COUNTRY = tuple(INTEREST_RATES[name] for name in sorted(_COUNTRY_FROM_STR, key=_COUNTRY_FROM_STR.get))
+
+_UNKNOWN_RATE = MappingProxyType({"interest_rate_percent": None, "as_of": "N/A"})
 
 def get_interest_rate(country="India"):
-    rate_data = INTEREST_RATES.get(country, {"interest_rate_percent": None, "as_of": "N/A"})
+    idx = _COUNTRY_FROM_STR.get(country)
+    rate_data = _RATES_BY_COUNTRY[idx] if idx is not None else _UNKNOWN_RATE
     return {"interest_rate": rate_data["interest_rate_percent"]}
 
-hardcoded_interest_tool = FunctionTool.from_defaults(fn=get_interest_rate)
\ No newline at end of file
+class InterestRateArgs(BaseModel):
+    country: str = "India"
+
+@cache
+def hardcoded_interest_tool():
+    from llama_index.core.tools import FunctionTool
+    return FunctionTool.from_defaults(
+        fn=get_interest_rate,
+        fn_schema=InterestRateArgs,
+        name="get_interest_rate",
+        description="Get the current central bank interest rate (%) for a country by full name, e.g. 'United States', 'India'"
+    )
\ No newline at end of file
@@ -0,0 +1,33 @@
+# tools/worldbank_common.py - HTTP client and country-code helpers shared by the World Bank tools
+import importlib.util
+import re
+import httpx
+
+# HTTP/2 needs the optional h2 package; without it httpx stays on HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# One async client for all World Bank tools so concurrent agent tool calls share pooled connections
+CLIENT = httpx.AsyncClient(
+    http2=_HTTP2,
+    timeout=10,
+    limits=httpx.Limits(max_keepalive_connections=20)
+)
+
+# World Bank country codes are ISO alpha-2 or alpha-3
+_WB_CODE = re.compile(r"[A-Za-z]{2,3}")
+
+# India + G7 (and China): request URLs for these codes are built once at import
+SUPPORTED_WB_CODES = ("US", "GB", "IN", "CN", "DE", "FR", "IT", "JP", "CA")
+
+def build_urls(template: str) -> dict:
+    """Prebuild request URLs for every supported code from a '{}' URL template."""
+    return {code: template.format(code) for code in SUPPORTED_WB_CODES}
+
+def resolve_url(country_code, template: str, urls: dict):
+    """Return the request URL for country_code, or None for a malformed country code."""
+    url = urls.get(country_code)
+    if url is not None:
+        return url
+    if not isinstance(country_code, str) or not _WB_CODE.fullmatch(country_code):
+        return None
+    return template.format(country_code.upper())
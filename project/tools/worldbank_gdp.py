@@ -1,6 +1,21 @@
 # tools/worldbank_gdp.py
+import orjson
 import requests
-from llama_index.core.tools import FunctionTool
+from functools import cache
+from pydantic import BaseModel
+from tools.worldbank_common import CLIENT, build_urls, resolve_url
+
+_GDP_URL_TEMPLATE = "https://api.worldbank.org/v2/country/{}/indicator/NY.GDP.MKTP.KD.ZG?format=json&date=2023:2023&per_page=1"
+_GDP_URLS = build_urls(_GDP_URL_TEMPLATE)
+
+def _gdp_url(country_code: str) -> str:
+    """Build the GDP request URL, or return None for a malformed country code."""
+    return resolve_url(country_code, _GDP_URL_TEMPLATE, _GDP_URLS)
+
+def _parse_gdp_growth(data) -> float:
+    if len(data) > 1 and data[1] and len(data[1]) > 0 and data[1][0].get('value'):
+        return float(data[1][0]['value'])
+    return None
 
 def get_gdp_growth(country_code: str = "US") -> float:
     """
@@ -12,27 +27,53 @@ def get_gdp_growth(country_code: str = "US") -> float:
     Returns:
         The GDP growth rate as a float, or None if data is not available
     """
-    url = f"https://api.worldbank.org/v2/country/{country_code}/indicator/NY.GDP.MKTP.KD.ZG?format=json&date=2023:2023"
+    url = _gdp_url(country_code)
+    if url is None:
+        return None
     
     try:
         response = requests.get(url, timeout=10)
         if response.status_code == 200:
-            data = response.json()
-            if len(data) > 1 and data[1] and len(data[1]) > 0 and data[1][0].get('value'):
-                return float(data[1][0]['value'])
-            return None
+            return _parse_gdp_growth(orjson.loads(response.content))
+    except Exception as e:
+        print(f"Error fetching GDP data: {e}")
+        return None
+    
+    return None
+
+async def get_gdp_growth_async(country_code: str = "US") -> float:
+    """
+    Async variant of get_gdp_growth using the shared HTTP/2 client, so the
+    agent can fetch several indicators concurrently.
+    """
+    url = _gdp_url(country_code)
+    if url is None:
+        return None
+    
+    try:
+        response = await CLIENT.get(url)
+        if response.status_code == 200:
+            return _parse_gdp_growth(orjson.loads(response.content))
     except Exception as e:
         print(f"Error fetching GDP data: {e}")
         return None
     
     return None
 
+class GDPGrowthArgs(BaseModel):
+    country_code: str = "US"
+
 # Create the tool instance
-worldbank_tool = FunctionTool.from_defaults(
-    fn=get_gdp_growth,
-    name="get_gdp_growth",
-    description="Get GDP growth rate for a specific country using World Bank data"
-)
+@cache
+def worldbank_tool():
+    from llama_index.core.tools import FunctionTool
+    return FunctionTool.from_defaults(
+        fn=get_gdp_growth,
+        async_fn=get_gdp_growth_async,
+        fn_schema=GDPGrowthArgs,
+        name="get_gdp_growth",
+        description="Get GDP growth rate for a specific country using World Bank data"
+    )
 
 
 
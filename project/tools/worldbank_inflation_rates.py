@@ -1,17 +1,56 @@
 # This file has inflation rates for India and G7 countries taken from World Bank API.
 # tools/worldbank_inflation.py
 
+import orjson
 import requests
-from llama_index.core.tools import FunctionTool
+from functools import cache
+from pydantic import BaseModel
+from tools.worldbank_common import CLIENT, build_urls, resolve_url
+
+_INFLATION_URL_TEMPLATE = "http://api.worldbank.org/v2/country/{}/indicator/FP.CPI.TOTL.ZG?format=json&per_page=1"
+_INFLATION_URLS = build_urls(_INFLATION_URL_TEMPLATE)
+
+def _inflation_url(country_code):
+    """Build the inflation request URL, or return None for a malformed country code."""
+    return resolve_url(country_code, _INFLATION_URL_TEMPLATE, _INFLATION_URLS)
+
+def _parse_inflation(data):
+    if len(data) == 2 and data[1]:
+        value = data[1][0]["value"]
+        return {"inflation_rate": round(float(value), 2)} if value else {"inflation_rate": None}
+    return {"inflation_rate": None}
 
 def get_worldbank_inflation(country_code="IN"):
-    url = f"http://api.worldbank.org/v2/country/{country_code}/indicator/FP.CPI.TOTL.ZG?format=json&per_page=1"
+    url = _inflation_url(country_code)
+    if url is None:
+        return {"inflation_rate": None}
     response = requests.get(url)
     if response.status_code == 200:
-        data = response.json()
-        if len(data) == 2 and data[1]:
-            value = data[1][0]["value"]
-            return {"inflation_rate": round(float(value), 2)} if value else {"inflation_rate": None}
+        return _parse_inflation(orjson.loads(response.content))
     return {"inflation_rate": None}
 
-worldbank_inflation_tool = FunctionTool.from_defaults(fn=get_worldbank_inflation)
\ No newline at end of file
+async def get_worldbank_inflation_async(country_code="IN"):
+    url = _inflation_url(country_code)
+    if url is None:
+        return {"inflation_rate": None}
+    try:
+        response = await CLIENT.get(url)
+        if response.status_code == 200:
+            return _parse_inflation(orjson.loads(response.content))
+    except Exception as e:
+        print(f"Error fetching inflation data: {e}")
+    return {"inflation_rate": None}
+
+class InflationArgs(BaseModel):
+    country_code: str = "IN"
+
+@cache
+def worldbank_inflation_tool():
+    from llama_index.core.tools import FunctionTool
+    return FunctionTool.from_defaults(
+        fn=get_worldbank_inflation,
+        async_fn=get_worldbank_inflation_async,
+        fn_schema=InflationArgs,
+        name="get_worldbank_inflation",
+        description="Get the latest annual inflation rate (%) for a country ISO code (e.g. 'IN', 'US') using World Bank data"
+    )
\ No newline at end of file
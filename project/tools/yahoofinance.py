@@ -1,45 +1,134 @@
 # tools/yahoofinance.py - Fixed version
+import atexit
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+import pandas as pd
 import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from pathlib import Path
 from typing import Optional, Dict, Any
-from llama_index.core.tools import FunctionTool
+from pydantic import BaseModel
 
-def get_stock_data(symbol: str, period: str = "1mo") -> Dict[str, Any]:
+@lru_cache(maxsize=256)
+def _ticker(symbol: str) -> yf.Ticker:
+    """Return a cached Ticker per symbol, for history() calls only.
+
+    history() refetches on every call, so reusing the object only skips rebuilding it.
+    .info must not go through here: the Ticker memoizes it for its whole lifetime.
+    """
+    return yf.Ticker(symbol)
+
+# On-disk parquet cache for price history, keyed by (symbol, period, interval).
+# Freshness follows the data: a bar that is still forming (its period covers
+# today) is live and kept briefly; otherwise the market is closed and the data
+# only needs rechecking often enough to catch the next session's first bar.
+# mkdtemp creates a fresh owner-only (0o700) directory, so nothing another
+# local user planted can be read back as market data; it is removed at exit.
+_CACHE_DIR = Path(tempfile.mkdtemp(prefix="yf_cache_"))
+atexit.register(shutil.rmtree, _CACHE_DIR, ignore_errors=True)
+_LIVE_TTL = 5 * 60
+_CLOSED_TTL = 15 * 60
+
+def _prune_history_cache():
+    """Remove cache files too old to be served (including leftovers from failed writes)"""
+    cutoff = time.time() - _CLOSED_TTL
+    for old in _CACHE_DIR.iterdir():
+        try:
+            if old.stat().st_mtime < cutoff:
+                old.unlink()
+        except OSError:
+            pass  # Already removed by another worker
+
+def _covers_today(hist: pd.DataFrame, interval: str) -> bool:
+    """Whether the latest bar's period includes today, i.e. its close is still moving."""
+    last = hist.index[-1]
+    now = pd.Timestamp.now(tz=last.tz)
+    if interval.endswith("mo"):
+        return (last.year, last.month) == (now.year, now.month)
+    return last.normalize() == now.normalize()
+
+def _cached_history(symbol: str, period: str, interval: str = "1d") -> pd.DataFrame:
+    """Return _ticker(symbol).history(period=period, interval=interval), served from disk while fresh."""
+    key = hashlib.blake2b(f"{symbol}:{period}:{interval}".encode(), digest_size=16).hexdigest()
+    path = _CACHE_DIR / f"{key}.parquet"
+    
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age < _CLOSED_TTL:
+            hist = pd.read_parquet(path)
+            if age < (_LIVE_TTL if _covers_today(hist, interval) else _CLOSED_TTL):
+                return hist
+    except Exception:
+        pass  # No usable cache entry; fetch fresh data below
+    
+    hist = _ticker(symbol).history(period=period, interval=interval)
+    if not hist.empty:
+        _prune_history_cache()
+        try:
+            # Write to a temp file and rename it into place so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+            os.close(fd)
+            try:
+                hist.to_parquet(tmp_path)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            print(f"Could not cache history for {symbol}: {e}")
+    return hist
+
+def get_stock_data(symbol: str, period: str = "1mo", include_fundamentals: bool = False) -> Dict[str, Any]:
     """
     Fetch stock data from Yahoo Finance.
     
     Args:
         symbol (str): Stock symbol (e.g., 'AAPL', 'GOOGL')
         period (str): Time period for data ('1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max')
+        include_fundamentals (bool): Also fetch company metadata (market cap, P/E, sector, ...),
+            which costs an extra, slower request
     
     Returns:
         Dict containing stock information
     """
     try:
-        stock = yf.Ticker(symbol)
-        
         # Get historical data
-        hist = stock.history(period=period)
+        hist = _cached_history(symbol, period)
         
-        # Get stock info
-        info = stock.info
+        closes = hist['Close'].to_numpy()
+        volumes = hist['Volume'].to_numpy()
         
         # Get current price
-        current_price = hist['Close'].iloc[-1] if not hist.empty else None
+        current_price = float(closes[-1]) if len(closes) else None
         
         # Calculate basic metrics
-        if len(hist) > 1:
-            price_change = hist['Close'].iloc[-1] - hist['Close'].iloc[-2]
-            price_change_pct = (price_change / hist['Close'].iloc[-2]) * 100
+        if len(closes) > 1:
+            prev_price = float(closes[-2])
+            price_change = current_price - prev_price
+            price_change_pct = (price_change / prev_price) * 100
         else:
-            price_change = 0
-            price_change_pct = 0
+            price_change = 0.0
+            price_change_pct = 0.0
             
-        return {
+        data = {
             "symbol": symbol,
-            "current_price": float(current_price) if current_price is not None else None,
-            "price_change": float(price_change),
-            "price_change_percent": float(price_change_pct),
-            "volume": int(hist['Volume'].iloc[-1]) if not hist.empty else None,
+            "current_price": current_price,
+            "price_change": price_change,
+            "price_change_percent": price_change_pct,
+            "volume": int(volumes[-1]) if len(volumes) else None
+        }
+        if not include_fundamentals:
+            return data
+        
+        # Get stock info
+        # Fresh Ticker: a cached one would keep serving its first .info fetch
+        info = yf.Ticker(symbol).info
+        
+        data.update({
             "market_cap": info.get('marketCap'),
             "pe_ratio": info.get('trailingPE'),
             "dividend_yield": info.get('dividendYield'),
@@ -48,7 +137,8 @@ def get_stock_data(symbol: str, period: str = "1mo") -> Dict[str, Any]:
             "company_name": info.get('longName', symbol),
             "sector": info.get('sector'),
             "industry": info.get('industry')
-        }
+        })
+        return data
         
     except Exception as e:
         return {
@@ -56,6 +146,65 @@ def get_stock_data(symbol: str, period: str = "1mo") -> Dict[str, Any]:
             "symbol": symbol
         }
 
+# Upper bound on concurrent Yahoo Finance requests per call
+_MAX_WORKERS = 16
+
+def _fetch_index(item):
+    """Fetch the daily change for one (name, symbol) index pair."""
+    name, symbol = item
+    try:
+        hist = _cached_history(symbol, "2d")
+        
+        if hist.empty:
+            return name, None
+        
+        closes = hist['Close'].to_numpy()
+        current_price = float(closes[-1])
+        if len(closes) > 1:
+            prev_price = float(closes[-2])
+            change = current_price - prev_price
+            change_pct = (change / prev_price) * 100
+        else:
+            change = 0.0
+            change_pct = 0.0
+            
+        return name, {
+            "symbol": symbol,
+            "current_price": current_price,
+            "change": change,
+            "change_percent": change_pct
+        }
+    except Exception as e:
+        return name, {"error": str(e)}
+
+def _fetch_sector(item):
+    """Fetch the monthly change for one (name, symbol) sector ETF pair."""
+    name, symbol = item
+    try:
+        # Monthly bars: only the previous month's close and the latest price are needed
+        hist = _cached_history(symbol, "1mo", interval="1mo")
+        if len(hist) == 1:
+            hist = _cached_history(symbol, "2mo", interval="1mo")
+        
+        closes = hist['Close'].to_numpy()
+        # The fallback can return three bars (two full months plus the current
+        # partial one), so the reference is always the bar before the latest
+        if len(closes) < 2:
+            return name, None
+        
+        current_price = float(closes[-1])
+        month_ago_price = float(closes[-2])
+        change = current_price - month_ago_price
+        change_pct = (change / month_ago_price) * 100
+        
+        return name, {
+            "symbol": symbol,
+            "current_price": current_price,
+            "monthly_change_percent": change_pct
+        }
+    except Exception as e:
+        return name, {"error": str(e)}
+
 def get_market_indices() -> Dict[str, Any]:
     """
     Get current data for major market indices.
@@ -71,33 +220,10 @@ def get_market_indices() -> Dict[str, Any]:
         "VIX": "^VIX"
     }
     
-    results = {}
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(indices))) as executor:
+        rows = executor.map(_fetch_index, indices.items())
     
-    for name, symbol in indices.items():
-        try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="2d")
-            
-            if not hist.empty:
-                current_price = hist['Close'].iloc[-1]
-                if len(hist) > 1:
-                    prev_price = hist['Close'].iloc[-2]
-                    change = current_price - prev_price
-                    change_pct = (change / prev_price) * 100
-                else:
-                    change = 0
-                    change_pct = 0
-                    
-                results[name] = {
-                    "symbol": symbol,
-                    "current_price": float(current_price),
-                    "change": float(change),
-                    "change_percent": float(change_pct)
-                }
-        except Exception as e:
-            results[name] = {"error": str(e)}
-            
-    return results
+    return {name: data for name, data in rows if data is not None}
 
 def get_sector_performance() -> Dict[str, Any]:
     """
@@ -120,47 +246,50 @@ def get_sector_performance() -> Dict[str, Any]:
         "Materials": "XLB"
     }
     
-    results = {}
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(sectors))) as executor:
+        rows = executor.map(_fetch_sector, sectors.items())
     
-    for name, symbol in sectors.items():
-        try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="1mo")
-            
-            if not hist.empty:
-                current_price = hist['Close'].iloc[-1]
-                month_ago_price = hist['Close'].iloc[0]
-                change = current_price - month_ago_price
-                change_pct = (change / month_ago_price) * 100
-                
-                results[name] = {
-                    "symbol": symbol,
-                    "current_price": float(current_price),
-                    "monthly_change_percent": float(change_pct)
-                }
-        except Exception as e:
-            results[name] = {"error": str(e)}
-            
-    return results
+    return {name: data for name, data in rows if data is not None}
+
+# Explicit tool argument schemas (skips signature introspection at import)
+class StockDataArgs(BaseModel):
+    symbol: str
+    period: str = "1mo"
+    include_fundamentals: bool = False
+
+class NoArgs(BaseModel):
+    pass
 
 # Create the function tools
-yahoofinance_tool = FunctionTool.from_defaults(
-    fn=get_stock_data,
-    name="get_stock_data",
-    description="Get current stock price, historical data, and key metrics for a given stock symbol from Yahoo Finance"
-)
-
-market_indices_tool = FunctionTool.from_defaults(
-    fn=get_market_indices,
-    name="get_market_indices", 
-    description="Get current prices and daily changes for major market indices (S&P 500, NASDAQ, Dow Jones, etc.)"
-)
-
-sector_performance_tool = FunctionTool.from_defaults(
-    fn=get_sector_performance,
-    name="get_sector_performance",
-    description="Get monthly performance data for major market sectors using sector ETFs"
-)
+@cache
+def yahoofinance_tool():
+    from llama_index.core.tools import FunctionTool
+    return FunctionTool.from_defaults(
+        fn=get_stock_data,
+        fn_schema=StockDataArgs,
+        name="get_stock_data",
+        description="Get current stock price and daily change for a given stock symbol from Yahoo Finance; set include_fundamentals=True for market cap, P/E, dividend yield and sector"
+    )
+
+@cache
+def market_indices_tool():
+    from llama_index.core.tools import FunctionTool
+    return FunctionTool.from_defaults(
+        fn=get_market_indices,
+        fn_schema=NoArgs,
+        name="get_market_indices",
+        description="Get current prices and daily changes for major market indices (S&P 500, NASDAQ, Dow Jones, etc.)"
+    )
+
+@cache
+def sector_performance_tool():
+    from llama_index.core.tools import FunctionTool
+    return FunctionTool.from_defaults(
+        fn=get_sector_performance,
+        fn_schema=NoArgs,
+        name="get_sector_performance",
+        description="Get monthly performance data for major market sectors using sector ETFs"
+    )
 
 
 